@@ -1,11 +1,30 @@
 import readline
+from bisect import bisect_left, insort
 from collections import UserDict
+import calendar
 import re
+import sys
 from datetime import datetime, timedelta
 import datetime as dt
+import json
 import pickle
 from prettytable import PrettyTable
 
+_PHONE_RE = re.compile(r"\d{10}")
+
+
+def _make_table(field_names):
+    table = PrettyTable()
+    table.field_names = field_names
+    return table
+
+
+_CONTACT_FIELDS = ["Name", "Phones", "Birthday"]
+_BIRTHDAY_FIELDS = ["Name", "Birthday"]
+_NOTE_FIELDS = ["ID", "Note", "Tags", "Creation Date"]
+_TAG_SEARCH_FIELDS = ["Note", "Tags"]
+
+
 class Field:
     def __init__(self, value):
         self.value = value
@@ -24,9 +43,16 @@ class Phone(Field):
             raise ValueError("Invalid phone number format. It should be 10 digits.")
         super().__init__(value)
 
+    @classmethod
+    def _unchecked(cls, value):
+        # For numbers that were already validated, e.g. loaded from disk.
+        phone = cls.__new__(cls)
+        phone.value = value
+        return phone
+
     @staticmethod
     def is_valid_phone(phone):
-        return re.fullmatch(r"\d{10}", phone) is not None
+        return _PHONE_RE.fullmatch(phone) is not None
 
 
 class Birthday(Field):
@@ -35,70 +61,140 @@ class Birthday(Field):
             self.value = datetime.strptime(value, "%d.%m.%Y").date()
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        self._formatted = self.value.strftime("%d.%m.%Y")
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "_formatted" not in state:
+            self._formatted = self.value.strftime("%d.%m.%Y")
 
     def __str__(self):
-        return self.value.strftime("%d.%m.%Y")
+        return self._formatted
 
 
 class Record:
     def __init__(self, name):
         self.name = Name(name)
-        self.phones = []
+        self.phones = {}
         self.birthday = None
+        # Birthday index callbacks of every AddressBook holding this record.
+        self._birthday_listeners = []
+
+    def __getstate__(self):
+        # Address books re-attach themselves when they are unpickled.
+        state = self.__dict__.copy()
+        state["_birthday_listeners"] = []
+        return state
+
+    def __setstate__(self, state):
+        # Address books pickled before phones became a dict stored a list.
+        phones = state.get("phones")
+        if isinstance(phones, list):
+            state["phones"] = {p.value: p for p in phones}
+        state.setdefault("_birthday_listeners", [])
+        self.__dict__.update(state)
 
     def add_phone(self, phone):
-        self.phones.append(Phone(phone))
+        self.phones[phone] = Phone(phone)
 
     def remove_phone(self, phone):
-        for p in self.phones:
-            if p.value == phone:
-                self.phones.remove(p)
-                return
-        raise ValueError(f"Phone {phone} not found.")
+        if self.phones.pop(phone, None) is None:
+            raise ValueError(f"Phone {phone} not found.")
 
     def edit_phone(self, old_phone, new_phone):
-        found = False
-        for p in self.phones:
-            if p.value == old_phone:
-                p.value = new_phone
-                found = True
-                break
-        if not found:
+        if old_phone not in self.phones:
             raise ValueError(f"Phone {old_phone} not found.")
         if not Phone.is_valid_phone(new_phone):
             raise ValueError("Invalid phone number format. It should be 10 digits.")
+        # Rebuild the dict so the edited number keeps its position.
+        phones = {}
+        for number, phone in self.phones.items():
+            if number == old_phone:
+                number, phone = new_phone, Phone._unchecked(new_phone)
+            phones[number] = phone
+        self.phones = phones
 
     def find_phone(self, phone):
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+        return self.phones.get(phone)
 
     def add_birthday(self, birthday):
+        old_birthday = self.birthday
         self.birthday = Birthday(birthday)
+        for listener in self._birthday_listeners:
+            listener(self, old_birthday)
 
     def __str__(self):
         birthday_str = f", birthday: {self.birthday}" if self.birthday else ""
-        return f"Contact name: {self.name}, phones: {'; '.join(p.value for p in self.phones)}{birthday_str}"
+        return f"Contact name: {self.name}, phones: {'; '.join(self.phones)}{birthday_str}"
     
     def to_dict(self):
         return {
             "Name": self.name.value,
-            "Phones": "; ".join(p.value for p in self.phones),
+            "Phones": "; ".join(self.phones),
             "Birthday": str(self.birthday) if self.birthday else "N/A",
         }
 
 
 class AddressBook(UserDict):
+    def __init__(self, *args, **kwargs):
+        # Sorted ((month, day), name) pairs used by get_upcoming_birthdays.
+        self._bday_index = []
+        super().__init__(*args, **kwargs)
+
+    def __copy__(self):
+        # UserDict.__copy__ would share _bday_index with the original.
+        return self.__class__(self.data)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._bday_index = []
+        for record in self.data.values():
+            self._attach(record)
+
+    def _attach(self, record):
+        record._birthday_listeners.append(self._birthday_changed)
+        if record.birthday:
+            insort(self._bday_index, (self._birthday_key(record.birthday), record.name.value))
+
+    def _detach(self, record):
+        record._birthday_listeners.remove(self._birthday_changed)
+        if record.birthday:
+            self._unindex_birthday(record.birthday, record.name.value)
+
+    def _birthday_changed(self, record, old_birthday):
+        if old_birthday:
+            self._unindex_birthday(old_birthday, record.name.value)
+        insort(self._bday_index, (self._birthday_key(record.birthday), record.name.value))
+
+    def _unindex_birthday(self, birthday, name):
+        entry = (self._birthday_key(birthday), name)
+        i = bisect_left(self._bday_index, entry)
+        if i < len(self._bday_index) and self._bday_index[i] == entry:
+            del self._bday_index[i]
+
+    @staticmethod
+    def _birthday_key(birthday):
+        return birthday.value.month, birthday.value.day
+
+    def __setitem__(self, name, record):
+        old_record = self.data.get(name)
+        if old_record is not None:
+            self._detach(old_record)
+        self.data[name] = record
+        self._attach(record)
+
+    def __delitem__(self, name):
+        self._detach(self.data.pop(name))
+
     def add_record(self, record):
-        self.data[record.name.value] = record
+        self[record.name.value] = record
 
     def find(self, name):
         return self.data.get(name)
 
     def delete(self, name):
         if name in self.data:
-            del self.data[name]
+            del self[name]
         else:
             raise KeyError(f"Contact {name} not found.")
 
@@ -126,24 +222,63 @@ class AddressBook(UserDict):
 
     ### new version of get_upcoming_birthdays
     def get_upcoming_birthdays(self, days=7):
-        today = dt.datetime.now().date()
+        if days <= 0:
+            return []
+        today = dt.date.today()
+        start = (today.month, today.day)
+        if start == (3, 1) and not calendar.isleap(today.year):
+            # 29 February birthdays are celebrated today.
+            start = (2, 29)
+        index = self._bday_index
+        lo = bisect_left(index, (start,))
+        if days > 365:
+            selected = index[lo:] + index[:lo]
+        else:
+            last_day = today + timedelta(days=days - 1)
+            hi = bisect_left(index, ((last_day.month, last_day.day + 1),))
+            if last_day.year == today.year:
+                selected = index[lo:hi]
+            else:
+                selected = index[lo:] + index[:hi]
+
         upcoming_birthdays = []
-        for record in self.data.values():
-            if record.birthday:
-                birthday = record.birthday.value
-                birthday_this_year = birthday.replace(year=today.year)
-                if birthday_this_year < today:
-                    birthday_this_year = birthday.replace(year=today.year + 1)
-                delta = birthday_this_year - today
-                if delta.days < days:
-                    upcoming_birthdays.append((record.name.value, birthday_this_year.strftime("%d.%m.%Y")))
+        for (month, day), name in selected:
+            year = today.year if (month, day) >= start else today.year + 1
+            # Selection already treats (2, 29) as 1 March in non-leap years
+            # (see start above); only the printed date needs adjusting here.
+            if month == 2 and day == 29 and not calendar.isleap(year):
+                month, day = 3, 1
+            upcoming_birthdays.append((name, f"{day:02d}.{month:02d}.{year}"))
         return upcoming_birthdays
     
+    def to_json(self):
+        return [
+            {
+                "name": record.name.value,
+                "phones": list(record.phones),
+                "birthday": str(record.birthday) if record.birthday else None,
+            }
+            for record in self.data.values()
+        ]
+
+    @classmethod
+    def from_json(cls, rows):
+        book = cls()
+        for row in rows:
+            record = Record(row["name"])
+            for phone in row["phones"]:
+                record.phones[phone] = Phone._unchecked(phone)
+            if row["birthday"]:
+                record.add_birthday(row["birthday"])
+            book.add_record(record)
+        return book
+
     def to_table(self):
-        table = PrettyTable()
-        table.field_names = ["Name", "Phones", "Birthday"]
-        for record in self.data.values():
-            table.add_row(record.to_dict().values())
+        table = _make_table(_CONTACT_FIELDS)
+        table.add_rows([
+            [record.name.value, "; ".join(record.phones), str(record.birthday) if record.birthday else "N/A"]
+            for record in self.data.values()
+        ])
         return table
 ### old version of parse_input
 # def parse_input(user_input):
@@ -158,14 +293,11 @@ class AddressBook(UserDict):
 
 ### new version of parse_input
 def parse_input(user_input):
-    if not user_input.strip():
-        return None, []
-    try:
-        cmd, *args = user_input.split()
-        cmd = cmd.strip().lower()
-        return cmd, args
-    except ValueError:
+    parts = user_input.split(None, 1)
+    if not parts:
         return None, []
+    args = parts[1].split() if len(parts) > 1 else []
+    return sys.intern(parts[0].lower()), args
 
 def input_error(func):
     def inner(*args, **kwargs):
@@ -221,8 +353,7 @@ def get_contact(args, book):
     if not record:
         raise KeyError(f"Contact {name} not found.")
     
-    table = PrettyTable()
-    table.field_names = ["Name", "Phones", "Birthday"]
+    table = _make_table(_CONTACT_FIELDS)
     table.add_row(record.to_dict().values())
     return table
 
@@ -269,20 +400,26 @@ def show_birthday(args, book):
         return f"No birthday set for {name}."
 
 
-def save_data(book, filename="addressbook.pkl"):
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+def save_data(book, filename="addressbook.json"):
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(book.to_json(), f, ensure_ascii=False)
 
 
-def load_data(filename="addressbook.pkl"):
+def load_data(filename="addressbook.json", legacy_filename="addressbook.pkl"):
+    try:
+        with open(filename, encoding="utf-8") as f:
+            return AddressBook.from_json(json.load(f))
+    except FileNotFoundError:
+        pass
+    # Fall back to the pickle written by earlier versions.
     try:
-        with open(filename, "rb") as f:
+        with open(legacy_filename, "rb") as f:
             return pickle.load(f)
     except FileNotFoundError:
         return AddressBook()
 
 
-COMMANDS = [
+COMMANDS = tuple(sys.intern(cmd) for cmd in (
     "hello",
     "add",
     "change",
@@ -300,38 +437,53 @@ COMMANDS = [
     "show-notes",
     "exit",
     "close",
-]
+))
+
+EXIT_COMMANDS = frozenset({"exit", "close"})
+
+
+COMMANDS_SORTED = sorted(COMMANDS)
 
 
 def completer(text, state):
-    options = [cmd for cmd in COMMANDS if cmd.startswith(text)]
-    if state < len(options):
-        return options[state]
+    # readline calls this with state 0, 1, 2, ... for one TAB press, so the
+    # matches are only looked up on the first call.
+    if state == 0:
+        lo = hi = bisect_left(COMMANDS_SORTED, text)
+        while hi < len(COMMANDS_SORTED) and COMMANDS_SORTED[hi].startswith(text):
+            hi += 1
+        completer.matches = COMMANDS_SORTED[lo:hi]
+    if state < len(completer.matches):
+        return completer.matches[state]
     else:
         return None
 
+
+completer.matches = []
+
+_COMMANDS_TABLE = _make_table(["Command", "Description"])
+_COMMANDS_TABLE.add_rows([
+    ["hello", "Display a greeting message"],
+    ["add", "Add a new contact"],
+    ["change", "Change an existing contact's phone number"],
+    ["phone", "Show a contact's phone number"],
+    ["all", "Show all contacts"],
+    ["delete", "Delete a contact"],
+    ["add-birthday", "Add a birthday to a contact"],
+    ["birthdays", "Show upcoming birthdays"],
+    ["show-birthday", "Show a contact's birthday"],
+    ["add-note", "Add a new note"],
+    ["delete-note", "Delete a note"],
+    ["add-tag", "Add a tag to a note"],
+    ["delete-tag", "Delete a tag from a note"],
+    ["find-tag", "Find notes by tag"],
+    ["show-notes", "Show all notes"],
+    ["exit/close", "Exit the program"],
+])
+
+
 def display_commands():
-    table = PrettyTable()
-    table.field_names = ["Command", "Description"]
-    table.add_rows([
-        ["hello", "Display a greeting message"],
-        ["add", "Add a new contact"],
-        ["change", "Change an existing contact's phone number"],
-        ["phone", "Show a contact's phone number"],
-        ["all", "Show all contacts"],
-        ["delete", "Delete a contact"],
-        ["add-birthday", "Add a birthday to a contact"],
-        ["birthdays", "Show upcoming birthdays"],
-        ["show-birthday", "Show a contact's birthday"],
-        ["add-note", "Add a new note"],
-        ["delete-note", "Delete a note"],
-        ["add-tag", "Add a tag to a note"],
-        ["delete-tag", "Delete a tag from a note"],
-        ["find-tag", "Find notes by tag"],
-        ["show-notes", "Show all notes"],
-        ["exit/close", "Exit the program"],
-    ])
-    print(table)
+    print(_COMMANDS_TABLE)
 
 class Tag(Field):
     pass
@@ -341,54 +493,137 @@ class Note:
         self.text = text
         self.tags = []
         self.creation_date = datetime.now()
+        self._tags_joined = None
+
+    def __setstate__(self, state):
+        state.setdefault("_tags_joined", None)
+        self.__dict__.update(state)
 
     def add_tag(self, tag):
         self.tags.append(Tag(tag))
+        self._tags_joined = None
 
     def remove_tag(self, tag):
         for t in self.tags:
             if t.value == tag:
                 self.tags.remove(t)
+                self._tags_joined = None
                 return
         raise ValueError(f"Tag {tag} not found.")
 
+    def joined_tags(self):
+        if self._tags_joined is None:
+            self._tags_joined = "; ".join(t.value for t in self.tags)
+        return self._tags_joined
+
     def __str__(self):
-        tags_str = f", tags: {'; '.join(t.value for t in self.tags)}" if self.tags else ""
+        tags_str = f", tags: {self.joined_tags()}" if self.tags else ""
         date_str = self.creation_date.strftime("%d.%m.%Y %H:%M:%S")
         return f"Note: {self.text}, created at: {date_str}{tags_str}"
     
     def to_dict(self):
         return {
             "Note": self.text,
-            "Tags": "; ".join(t.value for t in self.tags),
+            "Tags": self.joined_tags(),
             "Creation Date": self.creation_date.strftime("%d.%m.%Y %H:%M:%S")
         }
 
 
 class NoteBook(UserDict):
+    def __init__(self, *args, **kwargs):
+        # Maps each tag to the IDs of the notes carrying it.
+        self._tag_index = {}
+        super().__init__(*args, **kwargs)
+
+    def __copy__(self):
+        # UserDict.__copy__ would share _tag_index with the original.
+        return self.__class__(self.data)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._tag_index = {}
+        for note_id, note in self.data.items():
+            self._index_note(note_id, note)
+
+    def _index_note(self, note_id, note):
+        for t in note.tags:
+            self._tag_index.setdefault(t.value, set()).add(note_id)
+
+    def _unindex_note(self, note_id, note):
+        for t in note.tags:
+            self._unindex_tag(note_id, t.value)
+
+    def _unindex_tag(self, note_id, tag):
+        note_ids = self._tag_index.get(tag)
+        if note_ids is not None:
+            note_ids.discard(note_id)
+            if not note_ids:
+                del self._tag_index[tag]
+
+    def __setitem__(self, note_id, note):
+        if note_id in self.data:
+            self._unindex_note(note_id, self.data[note_id])
+        self.data[note_id] = note
+        self._index_note(note_id, note)
+
+    def __delitem__(self, note_id):
+        self._unindex_note(note_id, self.data.pop(note_id))
+
     def add_note(self, note):
-        self.data[len(self.data) + 1] = note
+        self[len(self.data) + 1] = note
 
     def delete_note(self, note_id):
         if note_id in self.data:
-            del self.data[note_id]
+            del self[note_id]
         else:
             raise KeyError(f"Note {note_id} not found.")
 
+    def add_tag(self, note_id, tag):
+        if note_id not in self.data:
+            raise KeyError(f"Note {note_id} not found.")
+        self.data[note_id].add_tag(tag)
+        self._tag_index.setdefault(tag, set()).add(note_id)
+
+    def remove_tag(self, note_id, tag):
+        if note_id not in self.data:
+            raise KeyError(f"Note {note_id} not found.")
+        note = self.data[note_id]
+        note.remove_tag(tag)
+        if not any(t.value == tag for t in note.tags):
+            self._unindex_tag(note_id, tag)
+
     def find_by_tag(self, tag):
-        found_notes = []
-        for note in self.data.values():
-            for t in note.tags:
-                if t.value == tag:
-                    found_notes.append(note)
-                    break
-        return found_notes
+        return [self.data[note_id] for note_id in sorted(self._tag_index.get(tag, ()))]
+
+    def to_json(self):
+        return [
+            {
+                "id": note_id,
+                "text": note.text,
+                "tags": [t.value for t in note.tags],
+                "created": note.creation_date.isoformat(),
+            }
+            for note_id, note in self.data.items()
+        ]
+
+    @classmethod
+    def from_json(cls, rows):
+        notebook = cls()
+        for row in rows:
+            note = Note(row["text"])
+            note.creation_date = datetime.fromisoformat(row["created"])
+            for tag in row["tags"]:
+                note.add_tag(tag)
+            notebook[row["id"]] = note
+        return notebook
 
     def to_table(self):
-        table = PrettyTable()
-        table.field_names = ["ID", "Note", "Tags", "Creation Date"]
+        table = _make_table(_NOTE_FIELDS)
+        rows = []
         for note_id, note in self.data.items():
-            table.add_row([note_id, note.to_dict()["Note"], note.to_dict()["Tags"], note.to_dict()["Creation Date"]])
+            note_dict = note.to_dict()
+            rows.append([note_id, note_dict["Note"], note_dict["Tags"], note_dict["Creation Date"]])
+        table.add_rows(rows)
         return table
 
 @input_error
@@ -415,9 +650,7 @@ def add_tag(args, notebook):
     if len(args) < 2:
         raise ValueError("Give me note ID and tag please.")
     note_id, tag = int(args[0]), args[1]
-    if note_id not in notebook.data:
-        raise KeyError(f"Note {note_id} not found.")
-    notebook.data[note_id].add_tag(tag)
+    notebook.add_tag(note_id, tag)
     return "Tag added."
 
 
@@ -426,9 +659,7 @@ def delete_tag(args, notebook):
     if len(args) < 2:
         raise ValueError("Give me note ID and tag please.")
     note_id, tag = int(args[0]), args[1]
-    if note_id not in notebook.data:
-        raise KeyError(f"Note {note_id} not found.")
-    notebook.data[note_id].remove_tag(tag)
+    notebook.remove_tag(note_id, tag)
     return "Tag deleted."
 
 
@@ -440,10 +671,8 @@ def find_by_tag(args, notebook):
     found_notes = notebook.find_by_tag(tag)
     if not found_notes:
         return f"No notes found with tag {tag}."
-    table = PrettyTable()
-    table.field_names = ["Note", "Tags"]
-    for note in found_notes:
-        table.add_row([note.to_dict()["Note"], note.to_dict()["Tags"]])
+    table = _make_table(_TAG_SEARCH_FIELDS)
+    table.add_rows([[note.text, note.joined_tags()] for note in found_notes])
     return table
 
 
@@ -453,29 +682,67 @@ def show_notes(notebook):
     else:
         return notebook.to_table()
 
-def save_notes(notebook, filename="notes.pkl"):
-    with open(filename, "wb") as f:
-        pickle.dump(notebook, f)
+def save_notes(notebook, filename="notes.json"):
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(notebook.to_json(), f, ensure_ascii=False)
 
 
-def load_notes(filename="notes.pkl"):
+def load_notes(filename="notes.json", legacy_filename="notes.pkl"):
     try:
-        with open(filename, "rb") as f:
+        with open(filename, encoding="utf-8") as f:
+            return NoteBook.from_json(json.load(f))
+    except FileNotFoundError:
+        pass
+    # Fall back to the pickle written by earlier versions.
+    try:
+        with open(legacy_filename, "rb") as f:
             return pickle.load(f)
     except FileNotFoundError:
         return NoteBook()
 
 
 
+
+COMMAND_DISPATCH = {
+    "add": lambda args, book, notebook: add_contact(args, book),
+    "change": lambda args, book, notebook: change_contact(args, book),
+    "phone": lambda args, book, notebook: get_contact(args, book),
+    "all": lambda args, book, notebook: all_contacts(book),
+    "delete": lambda args, book, notebook: delete_contact(args, book),
+    "add-birthday": lambda args, book, notebook: add_birthday(args, book),
+    "show-birthday": lambda args, book, notebook: show_birthday(args, book),
+    "add-note": lambda args, book, notebook: add_note(args, notebook),
+    "delete-note": lambda args, book, notebook: delete_note(args, notebook),
+    "add-tag": lambda args, book, notebook: add_tag(args, notebook),
+    "delete-tag": lambda args, book, notebook: delete_tag(args, notebook),
+    "find-tag": lambda args, book, notebook: find_by_tag(args, notebook),
+    "show-notes": lambda args, book, notebook: show_notes(notebook),
+}
+
+
+def read_commands(interactive):
+    if interactive:
+        while True:
+            try:
+                yield input("Please input command: ")
+            except EOFError:
+                return
+    else:
+        # Scripted input: read lines directly, without readline or prompts.
+        yield from sys.stdin
+
+
 def main():
     book = load_data()
     notebook = load_notes()
+    interactive = sys.stdin.isatty()
     print("Welcome to the assistant bot!")
-    display_commands()
-    readline.set_completer(completer)
-    readline.parse_and_bind("tab: complete")
-    while True:
-        user_input = input("Please input command: ").strip()
+    if interactive:
+        display_commands()
+        readline.set_completer(completer)
+        readline.parse_and_bind("tab: complete")
+    for user_input in read_commands(interactive):
+        user_input = user_input.strip()
         if not user_input:
             print("Please enter a command.")
             continue
@@ -483,42 +750,12 @@ def main():
         if command is None:
             print("Invalid input format.")
             continue
-        if command == "hello":
+        handler = COMMAND_DISPATCH.get(command)
+        if handler:
+            print(handler(args, book, notebook))
+        elif command == "hello":
             print("How can I help you?")
             display_commands()
-        elif command == "add":
-            print(add_contact(args, book))
-        elif command == "change":
-            print(change_contact(args, book))
-        elif command == "phone":
-            result = get_contact(args, book)
-            if isinstance(result, PrettyTable):
-                print(result)
-            else:
-                print(result)
-        elif command == "all":
-            result = all_contacts(book)
-            if isinstance(result, PrettyTable):
-                print(result)
-            else:
-                print(result)
-        elif command == "delete":
-            print(delete_contact(args, book))
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-        ### old version of birthdays    
-        # elif command == "birthdays":
-        #     upcoming_birthdays = book.get_upcoming_birthdays()
-        #     if upcoming_birthdays:
-        #         table = PrettyTable()
-        #         table.field_names = ["Name", "Birthday"]
-        #         for name, birthday in upcoming_birthdays:
-        #             table.add_row([name, birthday])
-        #         print("Upcoming birthdays in the next 7 days:")
-        #         print(table)
-        #     else:
-        #         print("No upcoming birthdays in the next 7 days.")
-        ### new version of birthdays
         elif command == "birthdays":
             if args:
                 try:
@@ -531,43 +768,21 @@ def main():
                 upcoming_birthdays = book.get_upcoming_birthdays()
 
             if upcoming_birthdays:
-                table = PrettyTable()
-                table.field_names = ["Name", "Birthday"]
-                for name, birthday in upcoming_birthdays:
-                    table.add_row([name, birthday])
+                table = _make_table(_BIRTHDAY_FIELDS)
+                table.add_rows(upcoming_birthdays)
                 print(f"Upcoming birthdays in the next {days if args else 7} days:")
                 print(table)
             else:
                 print(f"No upcoming birthdays in the next {days if args else 7} days.")
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-        elif command == "add-note":
-            print(add_note(args, notebook))
-        elif command == "delete-note":
-            print(delete_note(args, notebook))
-        elif command == "add-tag":
-            print(add_tag(args, notebook))
-        elif command == "delete-tag":
-            print(delete_tag(args, notebook))
-        elif command == "find-tag":
-            result = find_by_tag(args, notebook)
-            if isinstance(result, PrettyTable):
-                print(result)
-            else:
-                print(result)
-        elif command == "show-notes":
-            result = show_notes(notebook)
-            if isinstance(result, PrettyTable):
-                print(result)
-            else:
-                print(result)
-        elif command in ["exit", "close"]:
-            save_data(book)
-            save_notes(notebook)
-            print("Goodbye!")
+        elif command in EXIT_COMMANDS:
             break
         else:
             print("Command not found! Please try again")
+    # Reached on exit/close and when the input runs out, so scripted runs
+    # that don't end with exit still keep their changes.
+    save_data(book)
+    save_notes(notebook)
+    print("Goodbye!")
 
 
 if __name__ == "__main__":